@@ -158,8 +158,7 @@ def handle_tool_call(name: str, arguments: dict) -> dict:
 
         output_path = DATA_DIR / "selections.json"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(arguments, f, indent=2)
+        output_path.write_text(json.dumps(arguments, indent=2))
 
         # Count items for confirmation
         must_know = len(arguments.get("must_know", []))
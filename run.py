@@ -6,24 +6,38 @@ Pipeline: Fetch RSS → Claude curation → Email delivery
 """
 
 import argparse
+import atexit
 import csv
+import gzip
+import hashlib
 import html
 import json
 import math
+import multiprocessing
+import operator
 import os
+import random
 import re
 import shutil
+import socket
 import sqlite3
+import ssl
 import subprocess
 import sys
 import time
 import urllib.error
 import urllib.request
+import zlib
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext, suppress
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO, TypeGuard
 
 import feedparser
 import resend
@@ -36,12 +50,20 @@ import resend
 MAX_RETRIES = int(os.environ.get("RSS_MAX_RETRIES", "3"))  # Retry flaky RSS feeds
 RETRY_DELAY = int(os.environ.get("RSS_RETRY_DELAY", "2"))  # Base delay in seconds (exponential backoff)
 HEALTH_ALERT_THRESHOLD = int(os.environ.get("HEALTH_ALERT_THRESHOLD", "3"))  # Consecutive failures before alert
+MAX_FETCH_WORKERS = int(os.environ.get("RSS_MAX_WORKERS", "32"))  # Concurrent feed downloads (I/O-bound)
+# Processes for feedparser (CPU-bound, holds the GIL); 1 parses in the download threads instead.
+# Capped because in a container cpu_count() reports the host's cores, not the CPU quota.
+PARSE_WORKERS = int(os.environ.get("RSS_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+MAX_FEED_BYTES = 8 * 1024 * 1024  # Reject runaway feeds instead of buffering them whole
+FETCH_TIMEOUT = 15  # Seconds per request
+FAILING_SOURCE_TIMEOUT = 3  # Seconds per request for sources past HEALTH_ALERT_THRESHOLD
 
 # Article processing
 MAX_TOKENS_PER_FILE = 10000  # Conservative limit for Claude Code file reading
 MAX_TITLE_LENGTH = 500  # Cap title length for safety
 MAX_SUMMARY_LENGTH = 200  # Cap summary length
 DEDUP_WINDOW_DAYS = 7  # Days of headline history for deduplication
+SEEN_URL_RETENTION_DAYS = 30  # Days to remember article URLs already handed to Claude
 
 # Deduplication (TF-IDF pre-filter)
 DEDUP_SIMILARITY_THRESHOLD = float(os.environ.get("DEDUP_SIMILARITY_THRESHOLD", "0.35"))
@@ -52,6 +74,7 @@ DATA_DIR = APP_DIR / "data"
 DB_PATH = DATA_DIR / "digest.db"
 LOG_FILE = DATA_DIR / "digest.log"
 FETCHED_DIR = DATA_DIR / "fetched"
+FETCHED_ARTICLES_FILE = "articles.jsonl"  # In FETCHED_DIR: one article per line, tagged with source_id
 OUTPUT_DIR = DATA_DIR / "output"
 CLAUDE_INPUT_DIR = DATA_DIR / "claude_input"  # Intermediate files for Claude
 SOURCES_FILE = APP_DIR / "sources.json"
@@ -59,10 +82,21 @@ STYLES_FILE = APP_DIR / "digest.css"
 
 # Logging
 MAX_LOG_LINES = 1000  # Keep last N log lines
+MAX_LOG_BYTES = 256 * 1024  # Trim once the file grows past this, to at most half of it
+
+_RE_SOURCE_ID = re.compile(r"^[a-z0-9_]+$")
 
 
 def load_sources() -> list[dict]:
-    """Load and validate RSS sources from JSON file."""
+    """Load and validate RSS sources from JSON file (parsed once until the file changes)."""
+    stat = SOURCES_FILE.stat()
+    # Fresh dicts per call, so a caller mutating its sources can't change the cached copy
+    return [dict(s) for s in _load_sources_cached(stat.st_mtime_ns, stat.st_size)]
+
+
+@lru_cache(maxsize=4)
+def _load_sources_cached(mtime_ns: int, size: int) -> tuple[dict, ...]:
+    """Body of load_sources, keyed on the file's mtime/size."""
     with open(SOURCES_FILE) as f:
         sources = json.load(f)
 
@@ -75,12 +109,12 @@ def load_sources() -> list[dict]:
         if not source["url"].startswith(("http://", "https://")):
             raise ValueError(f"sources.json[{i}] invalid URL: {source['url']}")
         # Prevent path traversal - source_id is used in file paths
-        if not re.match(r"^[a-z0-9_]+$", source["id"]):
+        if not _RE_SOURCE_ID.match(source["id"]):
             raise ValueError(
                 f"sources.json[{i}] invalid id '{source['id']}': must be lowercase alphanumeric/underscore only"
             )
 
-    return sources
+    return tuple(sources)
 
 
 _source_name_to_id_cache: dict[str, str] | None = None
@@ -100,38 +134,71 @@ def get_source_id_by_name(name: str) -> str | None:
 # =============================================================================
 
 
+_log_fh: TextIO | None = None
+_log_fh_path: Path | None = None
+
+
 def log(message: str, level: str = "INFO"):
     """Log with UTC timestamp and level to stdout and file (with rotation).
 
     Levels: INFO (default), WARN, ERROR
     """
-    timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+    global _log_fh, _log_fh_path
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())  # No datetime object needed
     line = f"[{timestamp}] [{level}] {message}"
     print(line, flush=True)
 
-    DATA_DIR.mkdir(exist_ok=True)
-
-    # Read existing lines, append new, keep last N
-    lines = []
-    if LOG_FILE.exists():
-        lines = LOG_FILE.read_text().splitlines()
-    lines.append(line)
-    if len(lines) > MAX_LOG_LINES:
-        lines = lines[-MAX_LOG_LINES:]
-    LOG_FILE.write_text("\n".join(lines) + "\n")
+    # One line-buffered handle per run instead of an open/close per line
+    if _log_fh is None or _log_fh_path != LOG_FILE:
+        if _log_fh is not None:
+            _log_fh.close()
+        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _log_fh = open(LOG_FILE, "a", buffering=1)  # noqa: SIM115 - closed at exit
+        _log_fh_path = LOG_FILE
+        atexit.register(_log_fh.close)
+
+    # Append, and only rewrite the file once it passes the size cap. Keep the last N lines but
+    # no more than half the cap, so long lines can't leave it over the cap and rewrite every call
+    _log_fh.write(line + "\n")
+    if _log_fh.tell() > MAX_LOG_BYTES:
+        kept: list[str] = []
+        size = 0
+        for old in reversed(LOG_FILE.read_text().splitlines()[-MAX_LOG_LINES:]):
+            size += len(old.encode()) + 1
+            if size > MAX_LOG_BYTES // 2:
+                break
+            kept.append(old)
+        LOG_FILE.write_text("".join(f"{old}\n" for old in reversed(kept)))
+        _log_fh.seek(0, os.SEEK_END)
 
 
 def check_internet() -> bool:
-    """Check internet connectivity."""
+    """Check internet connectivity (plain TCP connect - no DNS lookup or TLS handshake)."""
+    if urllib.request.getproxies():
+        # Feeds go through the configured proxy; a direct connect may be blocked while it works
+        return True
     try:
-        req = urllib.request.Request("https://www.google.com/generate_204", headers={"User-Agent": "Mozilla/5.0"})
-        urllib.request.urlopen(req, timeout=5)  # nosec B310
+        socket.create_connection(("1.1.1.1", 443), timeout=3).close()
         return True
-    except (urllib.error.URLError, TimeoutError, OSError) as e:
+    except OSError as e:
         log(f"Internet check failed: {e}", "WARN")
         return False
 
 
+def staging_dir_for(target: Path) -> Path:
+    """Create an empty sibling directory to build the contents of target in."""
+    staging = target.with_name(target.name + ".new")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    return staging
+
+
+def swap_in_dir(staging: Path, target: Path):
+    """Replace target with a fully written staging directory, so readers never see it half-built."""
+    shutil.rmtree(target, ignore_errors=True)
+    staging.rename(target)
+
+
 def validate_env(dry_run: bool = False):
     """Check required environment variables. Exit if missing."""
     # ANTHROPIC_API_KEY is optional - Claude CLI can use `claude login` for Pro subscription
@@ -170,7 +237,10 @@ CREATE TABLE IF NOT EXISTS source_health (
     source_id TEXT NOT NULL,
     success INTEGER NOT NULL,
     error_message TEXT,
-    recorded_at DATETIME DEFAULT (datetime('now', 'utc'))
+    recorded_at DATETIME DEFAULT (datetime('now', 'utc')),
+    etag TEXT,
+    last_modified TEXT,
+    body_sha256 BLOB
 );
 
 CREATE TABLE IF NOT EXISTS digests (
@@ -190,6 +260,11 @@ CREATE TABLE IF NOT EXISTS dedup_log (
     action TEXT NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS seen_urls (
+    h INTEGER PRIMARY KEY,
+    first_seen INTEGER NOT NULL
+);
+
 CREATE INDEX IF NOT EXISTS idx_shown_narratives_date ON shown_narratives(shown_at);
 CREATE INDEX IF NOT EXISTS idx_shown_narratives_source ON shown_narratives(source_id);
 CREATE INDEX IF NOT EXISTS idx_digest_runs_date ON digest_runs(run_at);
@@ -199,11 +274,30 @@ CREATE INDEX IF NOT EXISTS idx_dedup_log_date ON dedup_log(logged_at);
 """
 
 
+_db_conn: sqlite3.Connection | None = None
+_db_conn_path: Path | None = None
+
+
+def get_db() -> sqlite3.Connection:
+    """Shared connection for the whole run, opened on first use and closed at exit.
+
+    Use as `with get_db() as conn:` - the block commits or rolls back but leaves it open.
+    """
+    global _db_conn, _db_conn_path
+    if _db_conn is None or _db_conn_path != DB_PATH:
+        if _db_conn is not None:
+            _db_conn.close()
+        _db_conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _db_conn_path = DB_PATH
+        atexit.register(_db_conn.close)
+    return _db_conn
+
+
 def init_db():
     """Initialize or migrate database."""
     DATA_DIR.mkdir(exist_ok=True)
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         # Create tables if they don't exist
         conn.executescript(DB_SCHEMA)
 
@@ -235,6 +329,52 @@ def init_db():
                 conn.rollback()
                 raise
 
+        # Migrate: one row per headline per day (drop existing repeats so the unique index can build)
+        cursor = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_shown_narratives_headline_day'"
+        )
+        if cursor.fetchone() is None:
+            try:
+                log("Migrating database: adding unique headline/day index to shown_narratives...")
+                conn.execute("""
+                    DELETE FROM shown_narratives WHERE id NOT IN (
+                        SELECT MIN(id) FROM shown_narratives GROUP BY headline, date(shown_at)
+                    )
+                """)
+                conn.execute(
+                    "CREATE UNIQUE INDEX idx_shown_narratives_headline_day ON shown_narratives(headline, date(shown_at))"
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                log(f"Migration failed: {e}", "ERROR")
+                conn.rollback()
+                raise
+
+        # Migrate: add HTTP cache validators to source_health if missing
+        cursor = conn.execute("PRAGMA table_info(source_health)")
+        columns = {row[1] for row in cursor.fetchall()}
+
+        if "etag" not in columns:
+            try:
+                log("Migrating database: adding etag/last_modified columns to source_health...")
+                conn.execute("ALTER TABLE source_health ADD COLUMN etag TEXT")
+                conn.execute("ALTER TABLE source_health ADD COLUMN last_modified TEXT")
+                conn.commit()
+            except sqlite3.Error as e:
+                log(f"Migration failed: {e}", "ERROR")
+                conn.rollback()
+                raise
+
+        if "body_sha256" not in columns:
+            try:
+                log("Migrating database: adding body_sha256 column to source_health...")
+                conn.execute("ALTER TABLE source_health ADD COLUMN body_sha256 BLOB")
+                conn.commit()
+            except sqlite3.Error as e:
+                log(f"Migration failed: {e}", "ERROR")
+                conn.rollback()
+                raise
+
         # Migrate: remove old unused columns by ignoring them (SQLite can't drop columns easily)
         # Old columns (timezone, narratives_presented) will just be ignored
 
@@ -244,7 +384,7 @@ def get_last_run_time() -> datetime | None:
     if not DB_PATH.exists():
         return None
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_db() as conn:
             cursor = conn.execute("SELECT MAX(run_at) FROM digest_runs")
             result = cursor.fetchone()[0]
             if result:
@@ -257,7 +397,7 @@ def get_last_run_time() -> datetime | None:
 def record_run(articles_fetched: int, articles_emailed: int = 0) -> int | None:
     """Record a successful digest run. Returns run ID or None on error."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_db() as conn:
             cursor = conn.execute(
                 "INSERT INTO digest_runs (articles_fetched, articles_emailed) VALUES (?, ?)",
                 (articles_fetched, articles_emailed),
@@ -270,20 +410,23 @@ def record_run(articles_fetched: int, articles_emailed: int = 0) -> int | None:
         return None
 
 
-def save_digest(digest_path: Path):
-    """Save digest HTML to database for web serving."""
-    # Extract date from filename (digest-YYYY-MM-DD*.html -> YYYY-MM-DD)
-    match = re.search(r"(\d{4}-\d{2}-\d{2})", digest_path.stem)
+_RE_DIGEST_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+def get_digest_date(digest_path: Path) -> str:
+    """Extract date from digest filename (digest-YYYY-MM-DD*.html -> YYYY-MM-DD)."""
+    match = _RE_DIGEST_DATE.search(digest_path.stem)
     if match:
-        date_str = match.group(1)
-    else:
-        date_str = datetime.now(UTC).strftime("%Y-%m-%d")
-        log(f"Could not extract date from '{digest_path.stem}', using {date_str}", "WARN")
+        return match.group(1)
+    date_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    log(f"Could not extract date from '{digest_path.stem}', using {date_str}", "WARN")
+    return date_str
 
-    html_content = digest_path.read_text()
 
+def save_digest(date_str: str, html_content: str):
+    """Save digest HTML to database for web serving."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_db() as conn:
             conn.execute("INSERT OR REPLACE INTO digests (date, html) VALUES (?, ?)", (date_str, html_content))
         log(f"Saved digest to database: {date_str}")
     except sqlite3.Error as e:
@@ -295,7 +438,9 @@ def get_previous_headlines(days: int = 7) -> list[dict]:
     if not DB_PATH.exists():
         return []
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_db() as conn:
+            # Plain rows rather than json_group_array: SQLite doesn't promise an aggregate keeps
+            # a subquery's ORDER BY (aggregate ORDER BY needs 3.44+)
             cursor = conn.execute(
                 """
                 SELECT headline, tier, date(shown_at) as date
@@ -305,7 +450,7 @@ def get_previous_headlines(days: int = 7) -> list[dict]:
             """,
                 (f"-{days} days",),
             )
-            return [{"headline": row[0], "tier": row[1], "date": row[2]} for row in cursor.fetchall()]
+            return [{"headline": headline, "tier": tier, "date": date} for headline, tier, date in cursor]
     except sqlite3.Error as e:
         log(f"DB error getting previous headlines: {e}", "ERROR")
         return []
@@ -324,71 +469,147 @@ def record_shown_headlines(headlines: list[dict]):
         log(f"First item: {repr(headlines[0][:100]) if isinstance(headlines[0], str) else repr(headlines[0])}", "ERROR")
         return
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.executemany(
-                "INSERT INTO shown_narratives (headline, tier, source_id) VALUES (?, ?, ?)",
-                [(h.get("headline", ""), h.get("tier", ""), h.get("source_id")) for h in headlines],
+        with get_db() as conn:
+            # One write transaction for the batch; the unique (headline, day) index drops repeats,
+            # e.g. when a digest is re-sent or re-recorded the same day
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.executemany(
+                "INSERT OR IGNORE INTO shown_narratives (headline, tier, source_id) VALUES (?, ?, ?)",
+                ((h.get("headline", ""), h.get("tier", ""), h.get("source_id")) for h in headlines),
             )
-        log(f"Saved {len(headlines)} headlines to dedup history")
+            saved = cursor.rowcount
+        skipped = len(headlines) - saved
+        log(f"Saved {saved} headlines to dedup history" + (f" ({skipped} already recorded today)" if skipped else ""))
     except sqlite3.Error as e:
         log(f"DB error recording headlines: {e}", "ERROR")
 
 
-def record_source_health(results: list[tuple[str, bool, str | None]]):
-    """Record source fetch results. Each tuple is (source_id, success, error_message)."""
+# Per-source fetch cache carried between runs: (etag, last_modified, body_sha256)
+FeedCache = tuple[str | None, str | None, bytes | None]
+NO_FEED_CACHE: FeedCache = (None, None, None)
+
+
+def record_source_health(results: list[tuple[str, bool, str | None, str | None, str | None, bytes | None]]):
+    """Record source fetch results.
+
+    Each tuple is (source_id, success, error_message, etag, last_modified, body_sha256).
+    """
     if not results:
         return
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.executemany("INSERT INTO source_health (source_id, success, error_message) VALUES (?, ?, ?)", results)
+        with get_db() as conn:
+            conn.executemany(
+                "INSERT INTO source_health (source_id, success, error_message, etag, last_modified, body_sha256)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                results,
+            )
     except sqlite3.Error as e:
         log(f"DB error recording source health for {len(results)} sources: {e}", "ERROR")
 
 
-def get_consecutive_failures(source_id: str, limit: int = 10) -> int:
-    """Get count of consecutive recent failures for a source."""
-    if not DB_PATH.exists():
-        return 0
+def get_feed_cache(before: datetime | None) -> dict[str, FeedCache]:
+    """Get (etag, last_modified, body_sha256) from each source's latest successful fetch before a time.
+
+    Pass the last completed run: a fetch from a dry, unrecorded or failed run never reached
+    a digest, so matching it would skip articles nobody has been sent. None means no cache.
+    """
+    if before is None or not DB_PATH.exists():
+        return {}
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_db() as conn:
             cursor = conn.execute(
                 """
-                SELECT success FROM source_health
-                WHERE source_id = ?
-                ORDER BY recorded_at DESC
-                LIMIT ?
-            """,
-                (source_id, limit),
+                SELECT source_id, etag, last_modified, body_sha256 FROM source_health
+                WHERE id IN (
+                    SELECT MAX(id) FROM source_health WHERE success = 1 AND recorded_at < ? GROUP BY source_id
+                )
+                  AND (etag IS NOT NULL OR last_modified IS NOT NULL OR body_sha256 IS NOT NULL)
+                """,
+                (before.strftime("%Y-%m-%d %H:%M:%S"),),
             )
-            count = 0
-            for (success,) in cursor:
-                if success:
-                    break
-                count += 1
-            return count
+            return {sid: (etag, last_modified, body_sha256) for sid, etag, last_modified, body_sha256 in cursor}
     except sqlite3.Error as e:
-        log(f"DB error getting consecutive failures for {source_id}: {e}", "ERROR")
-        return 0
+        log(f"DB error getting feed cache: {e}", "ERROR")
+        return {}
+
+
+def url_hash(url: str) -> int:
+    """64-bit BLAKE2b of a URL as a signed int, so it fits an SQLite INTEGER PRIMARY KEY."""
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "little", signed=True)
+
 
+SQL_CHUNK_SIZE = 500  # Bound parameters per IN (...) query, well under SQLite's limit
 
-def get_failing_sources(min_consecutive: int = 3) -> list[tuple[str, int]]:
-    """Get sources with N+ consecutive failures. Returns [(source_id, failure_count)]."""
+
+def get_seen_url_hashes(hashes: set[int], before: datetime) -> set[int]:
+    """Return the subset of URL hashes first seen before the given time."""
+    if not hashes or not DB_PATH.exists():
+        return set()
+    cutoff = int(before.timestamp())
+    pending = list(hashes)
+    seen: set[int] = set()
+    try:
+        with get_db() as conn:
+            for i in range(0, len(pending), SQL_CHUNK_SIZE):
+                chunk = pending[i : i + SQL_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT h FROM seen_urls WHERE first_seen < ? AND h IN ({placeholders})",  # nosec B608
+                    (cutoff, *chunk),
+                )
+                seen.update(h for (h,) in cursor)
+    except sqlite3.Error as e:
+        log(f"DB error checking seen URLs: {e}", "ERROR")
+    return seen
+
+
+def record_seen_urls(hashes: set[int]):
+    """Remember URL hashes (first sighting wins) and forget ones past the retention window."""
+    now = int(time.time())
+    try:
+        with get_db() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (h, first_seen) VALUES (?, ?)", ((h, now) for h in hashes)
+            )
+            conn.execute("DELETE FROM seen_urls WHERE first_seen < ?", (now - SEEN_URL_RETENTION_DAYS * 86400,))
+    except sqlite3.Error as e:
+        log(f"DB error recording seen URLs: {e}", "ERROR")
+
+
+def get_failing_sources(min_consecutive: int = 3, limit: int = 10) -> list[tuple[str, int]]:
+    """Get sources with N+ consecutive failures. Returns [(source_id, failure_count)].
+
+    Failures are counted back from each source's latest fetch to its most recent
+    success, looking at no more than `limit` fetches.
+    """
     if not DB_PATH.exists():
         return []
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cursor = conn.execute("""
-                SELECT DISTINCT source_id FROM source_health
-                WHERE recorded_at > datetime('now', '-7 days')
-            """)
-            source_ids = [row[0] for row in cursor]
+        with get_db() as conn:
+            cursor = conn.execute(
+                """
+                WITH recent AS (
+                    SELECT source_id, success,
+                           ROW_NUMBER() OVER (PARTITION BY source_id ORDER BY recorded_at DESC, id DESC) AS rn
+                    FROM source_health
+                    WHERE source_id IN (
+                        SELECT source_id FROM source_health WHERE recorded_at > datetime('now', '-7 days')
+                    )
+                )
+                SELECT source_id, COALESCE(MIN(CASE WHEN success THEN rn END) - 1, COUNT(*)) AS failures
+                FROM recent
+                WHERE rn <= ?
+                GROUP BY source_id
+                HAVING failures >= ?
+                ORDER BY failures DESC
+            """,
+                (limit, min_consecutive),
+            )
+            return cursor.fetchall()
     except sqlite3.Error as e:
         log(f"DB error getting failing sources: {e}", "ERROR")
         return []
 
-    failing = [(sid, count) for sid in source_ids if (count := get_consecutive_failures(sid)) >= min_consecutive]
-    return sorted(failing, key=lambda x: -x[1])
-
 
 def log_dedup_action(
     article_title: str,
@@ -400,7 +621,7 @@ def log_dedup_action(
 ):
     """Log a dedup decision to the database."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_db() as conn:
             conn.execute(
                 """INSERT INTO dedup_log
                    (article_title, article_source_id, matched_headline, similarity, threshold, action)
@@ -554,11 +775,19 @@ STOPWORDS = frozenset(
 )
 
 
+_RE_WORD = re.compile(r"\w+")
+
+
 def tokenize(text: str) -> list[str]:
     """Lowercase, strip punctuation, split into words, remove stopwords."""
-    text = text.lower()
-    text = re.sub(r"[^\w\s]", " ", text)
-    return [w for w in text.split() if w not in STOPWORDS]
+    return list(_tokenize_cached(text))
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_cached(text: str) -> tuple[str, ...]:
+    """Memoized body of tokenize: wire stories repeat the same headline across feeds."""
+    # Words are maximal \w runs - the same tokens as blanking punctuation and splitting, in one pass
+    return tuple(w for w in _RE_WORD.findall(text.lower()) if w not in STOPWORDS)
 
 
 class TfidfMatcher:
@@ -568,8 +797,14 @@ class TfidfMatcher:
         self.headlines = headlines
         self._documents = [tokenize(h) for h in headlines]
         self.idf = self._compute_idf()
-        # Pre-compute vectors for corpus (queried many times)
+        # Pre-compute vectors and magnitudes for corpus (queried many times)
         self._doc_vectors = [self._tfidf_vector(doc) for doc in self._documents]
+        self._doc_norms = [self._norm(vec) for vec in self._doc_vectors]
+        # Inverted index: word -> [(doc index, weight)], so a query only touches docs sharing a word
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for i, vec in enumerate(self._doc_vectors):
+            for word, weight in vec.items():
+                self._postings.setdefault(word, []).append((i, weight))
 
     def _compute_idf(self) -> dict[str, float]:
         """Compute inverse document frequency for each word."""
@@ -591,30 +826,29 @@ class TfidfMatcher:
         max_tf = max(tf.values())
         return {word: (count / max_tf) * self.idf[word] for word, count in tf.items() if word in self.idf}
 
-    def _cosine_similarity(self, vec1: dict[str, float], vec2: dict[str, float]) -> float:
-        """Compute cosine similarity between two sparse vectors."""
-        if not vec1 or not vec2:
-            return 0.0
-        # Only iterate over shared keys for dot product (others contribute 0)
-        shared_keys = vec1.keys() & vec2.keys()
-        if not shared_keys:
-            return 0.0
-        dot = sum(vec1[w] * vec2[w] for w in shared_keys)
-        mag1 = math.sqrt(sum(v * v for v in vec1.values()))
-        mag2 = math.sqrt(sum(v * v for v in vec2.values()))
-        return dot / (mag1 * mag2)
+    @staticmethod
+    def _norm(vec: dict[str, float]) -> float:
+        """Euclidean magnitude of a sparse vector."""
+        return math.sqrt(sum(v * v for v in vec.values()))
 
     def find_most_similar(self, text: str) -> tuple[str | None, float]:
-        """Find most similar headline and its similarity score."""
-        if not self.headlines:
+        """Find most similar headline and its similarity score (cosine over TF-IDF vectors)."""
+        query_vec = self._tfidf_vector(tokenize(text))
+        query_norm = self._norm(query_vec)
+        if not query_norm:
             return None, 0.0
 
-        query_vec = self._tfidf_vector(tokenize(text))
+        # Dot products via the inverted index - headlines sharing no word score 0 and are never visited
+        dots: dict[int, float] = {}
+        for word, weight in query_vec.items():
+            for i, doc_weight in self._postings.get(word, ()):
+                dots[i] = dots.get(i, 0.0) + weight * doc_weight
+
         best_headline = None
         best_score = 0.0
-
-        for i, doc_vec in enumerate(self._doc_vectors):
-            score = self._cosine_similarity(query_vec, doc_vec)
+        for i in sorted(dots):  # Corpus order, so ties go to the earliest headline as before
+            doc_norm = self._doc_norms[i]
+            score = dots[i] / (query_norm * doc_norm) if doc_norm else 0.0
             if score > best_score:
                 best_score = score
                 best_headline = self.headlines[i]
@@ -631,10 +865,16 @@ def parse_date(date_str: str | None) -> datetime | None:
     """Parse RSS date formats (ISO 8601 or RFC 2822)."""
     if not date_str:
         return None
+    return _parse_date_cached(date_str)
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_cached(date_str: str) -> datetime | None:
+    """Memoized body of parse_date: feeds repeat timestamps heavily, and datetimes are immutable."""
+    # ISO 8601 first: 2025-01-15T10:30:00Z - one C call, and the format entry_to_article stores
+    with suppress(ValueError):
+        return datetime.fromisoformat(date_str).astimezone(UTC)
     try:
-        # ISO 8601: 2025-01-15T10:30:00Z (has digit-T-digit pattern)
-        if re.search(r"\dT\d", date_str):
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00")).astimezone(UTC)
         # RFC 2822: Tue, 15 Jan 2025 10:30:00 GMT
         return parsedate_to_datetime(date_str).astimezone(UTC)
     except (ValueError, TypeError):
@@ -642,63 +882,170 @@ def parse_date(date_str: str | None) -> datetime | None:
         return None
 
 
-def fetch_source(source: dict, timeout: int = 15) -> tuple[str, list[dict], str | None]:
-    """Fetch single RSS source with retry logic. Returns (source_id, articles, error_or_none)."""
+UTC_ISO_LENGTH = len("2025-01-15T10:30:00+00:00")
+
+
+def is_utc_isoformat(date_str: str | None) -> TypeGuard[str]:
+    """True for second-precision UTC isoformat() strings, as entry_to_article produces.
+
+    These order correctly as plain text, so comparisons can skip date parsing.
+    """
+    return (
+        date_str is not None and len(date_str) == UTC_ISO_LENGTH and date_str[10] == "T" and date_str.endswith("+00:00")
+    )
+
+
+def published_after(published: str | None, cutoff: datetime, cutoff_iso: str) -> bool:
+    """True if published is after cutoff, or has no parseable date. cutoff_iso is cutoff.isoformat()."""
+    if is_utc_isoformat(published) and is_utc_isoformat(cutoff_iso):
+        return published > cutoff_iso
+    pub = parse_date(published)
+    return pub is None or pub > cutoff
+
+
+def entry_to_article(entry: dict) -> dict | None:
+    """Convert a feedparser entry to an article dict, or None if it lacks a title or link."""
+    title: str = entry.get("title", "").strip()
+    url: str = entry.get("link", "")
+    if not title or not url:
+        return None
+
+    published = entry.get("published_parsed") or entry.get("updated_parsed")
+    pub_str: str | None
+    if published:
+        try:
+            pub_str = datetime(*published[:6], tzinfo=UTC).isoformat()  # type: ignore[misc]
+        except (TypeError, ValueError):
+            pub_str = entry.get("published") or entry.get("updated")
+    else:
+        pub_str = entry.get("published") or entry.get("updated")
+
+    return {
+        "title": title,
+        "url": url,
+        "published": pub_str,
+        "summary": (entry.get("summary") or entry.get("description") or "")[:500],
+    }
+
+
+def parse_feed(data: bytes) -> tuple[list[dict], str | None]:
+    """Parse a feed body into articles. Returns (articles, error_or_none).
+
+    Module-level and picklable so fetch_feeds can run it in a process pool.
+    """
+    # Skip feedparser's HTML sanitizer and relative-URI rewriting (its hottest paths):
+    # prepare_claude_input() strips tags and escapes text itself, and links are absolute
+    feed = feedparser.parse(data, sanitize_html=False, resolve_relative_uris=False)
+    if feed.bozo and not feed.entries:
+        return [], f"Feed parse error: {feed.bozo_exception}"
+    return [article for entry in feed.entries if (article := entry_to_article(entry))], None
+
+
+# Shared TLS context for every feed fetch. Without it each HTTPS connection builds its own
+# context and reloads the CA store (~30ms of CPU per feed). urllib can't keep connections alive.
+_feed_opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl.create_default_context()))
+
+
+def read_feed_body(response) -> bytes:
+    """Read and decode a feed response, returning at most MAX_FEED_BYTES + 1 bytes.
+
+    Compressed bodies are decompressed under the same cap, so a small
+    compressed payload can't expand past it. A corrupt body raises
+    gzip.BadGzipFile, EOFError or zlib.error.
+    """
+    limit = MAX_FEED_BYTES + 1  # One extra byte tells the caller the feed was too big
+    encoding = response.headers.get("Content-Encoding", "").strip().lower()
+    if encoding == "gzip":
+        return gzip.GzipFile(fileobj=response).read(limit)
+    if encoding == "deflate":
+        body = response.read(limit)
+        try:
+            return zlib.decompressobj().decompress(body, limit)
+        except zlib.error:
+            # Many servers send raw deflate without the zlib header that the spec calls for
+            return zlib.decompressobj(-zlib.MAX_WBITS).decompress(body, limit)
+    return response.read(limit)
+
+
+def fetch_source(
+    source: dict, timeout: int = FETCH_TIMEOUT, cache: FeedCache = NO_FEED_CACHE, parser: Executor | None = None
+) -> tuple[str, list[dict], str | None, FeedCache]:
+    """Fetch single RSS source with retry logic.
+
+    cache is the (etag, last_modified, body_sha256) of the last fetch that fed a completed run
+    (see get_feed_cache). Unchanged feeds are skipped without parsing: on 304 Not Modified,
+    or when the body hashes the same.
+    parser, if given, is a process pool to run parse_feed in; otherwise it runs in this thread.
+    A shortened timeout applies to all but the last attempt, which always gets FETCH_TIMEOUT
+    so a slow but working feed can still succeed.
+    Returns (source_id, articles, error_or_none, cache_for_next_run).
+    """
     source_id = source["id"]
     last_error = None
+    etag, last_modified, body_sha256 = cache
+    headers = {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
     for attempt in range(MAX_RETRIES):
         try:
-            req = urllib.request.Request(source["url"], headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=timeout) as response:  # nosec B310
-                data = response.read()
-            feed = feedparser.parse(data)
-
-            if feed.bozo and not feed.entries:
-                # Parse error - don't retry, feed is malformed
-                error_msg = f"Feed parse error: {feed.bozo_exception}"
+            req = urllib.request.Request(source["url"], headers=headers)
+            attempt_timeout = max(timeout, FETCH_TIMEOUT) if attempt == MAX_RETRIES - 1 else timeout
+            with _feed_opener.open(req, timeout=attempt_timeout) as response:  # nosec B310
+                data = read_feed_body(response)
+                etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if len(data) > MAX_FEED_BYTES:
+                error_msg = f"Feed exceeds {MAX_FEED_BYTES // (1024 * 1024)} MiB limit"
                 print(f"  [{source_id}] {error_msg}", flush=True)
-                return source_id, [], error_msg
-
-            articles = []
-            for entry in feed.entries:
-                published = entry.get("published_parsed") or entry.get("updated_parsed")
-                if published:
-                    try:
-                        pub_str = datetime(*published[:6], tzinfo=UTC).isoformat()  # type: ignore[misc]
-                    except (TypeError, ValueError):
-                        pub_str = entry.get("published") or entry.get("updated")
-                else:
-                    pub_str = entry.get("published") or entry.get("updated")
-
-                article = {
-                    "title": entry.get("title", "").strip(),
-                    "url": entry.get("link", ""),
-                    "published": pub_str,
-                    "summary": (entry.get("summary") or entry.get("description") or "")[:500],
-                }
-                if article["title"] and article["url"]:
-                    articles.append(article)
+                return source_id, [], error_msg, NO_FEED_CACHE
+            digest = hashlib.sha256(data).digest()
+            if digest == body_sha256:
+                # Server ignored the validators but sent the same bytes - nothing new to parse
+                print(f"  [{source_id}] Unchanged", flush=True)
+                return source_id, [], None, (etag, last_modified, digest)
+            try:
+                articles, parse_error = parser.submit(parse_feed, data).result() if parser else parse_feed(data)
+            except BrokenProcessPool:
+                # A parse worker died (e.g. OOM-killed) and took the pool with it - parse here instead
+                print(f"  [{source_id}] Parse pool broken, parsing in thread", flush=True)
+                articles, parse_error = parse_feed(data)
+            if parse_error:
+                # Parse error - don't retry, feed is malformed
+                print(f"  [{source_id}] {parse_error}", flush=True)
+                return source_id, [], parse_error, NO_FEED_CACHE
 
-            return source_id, articles, None  # Success
+            return source_id, articles, None, (etag, last_modified, digest)  # Success
 
+        except (gzip.BadGzipFile, EOFError, zlib.error) as e:
+            # Corrupt compressed body - malformed like a parse error, so don't retry
+            # (caught before OSError, which BadGzipFile subclasses)
+            error_msg = f"Feed decode error: {e}"
+            print(f"  [{source_id}] {error_msg}", flush=True)
+            return source_id, [], error_msg, NO_FEED_CACHE
         except (urllib.error.URLError, TimeoutError, OSError) as e:
+            if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                # Unchanged since last fetch - nothing new to parse; keep the cache for next run
+                print(f"  [{source_id}] Not modified", flush=True)
+                return source_id, [], None, cache
             # Transient errors - retry with exponential backoff
             last_error = e
             if attempt < MAX_RETRIES - 1:
-                delay = RETRY_DELAY * (2**attempt)  # 1s, 2s, 4s
+                # Exponential backoff, jittered so threads retrying a shared CDN don't move in lockstep
+                delay = RETRY_DELAY * (2**attempt) * random.uniform(0.5, 1.5)  # nosec B311
                 time.sleep(delay)
             continue
         except Exception as e:
             # Non-transient error - don't retry
             error_msg = f"{type(e).__name__}: {e}"
             print(f"  [{source_id}] Error: {error_msg}", flush=True)
-            return source_id, [], error_msg
+            return source_id, [], error_msg, NO_FEED_CACHE
 
     # All retries exhausted
     error_msg = str(getattr(last_error, "reason", last_error)) if last_error else "Unknown"
     print(f"  [{source_id}] Failed after {MAX_RETRIES} retries: {error_msg}", flush=True)
-    return source_id, [], f"Failed after {MAX_RETRIES} retries: {error_msg}"
+    return source_id, [], f"Failed after {MAX_RETRIES} retries: {error_msg}", NO_FEED_CACHE
 
 
 def fetch_feeds(sources: list[dict]) -> tuple[int, int]:
@@ -706,40 +1053,69 @@ def fetch_feeds(sources: list[dict]) -> tuple[int, int]:
     log(f"Fetching {len(sources)} RSS feeds...")
 
     last_run = get_last_run_time()
-
-    FETCHED_DIR.mkdir(parents=True, exist_ok=True)
-    for f in FETCHED_DIR.glob("*.json"):
-        f.unlink()
+    last_run_iso = last_run.isoformat() if last_run else ""
+    # Validators only from fetches that fed a completed run - same cutoff as seen_urls below
+    feed_cache = get_feed_cache(last_run)
+    # Known-dead feeds get a short timeout so they don't hold pool threads through every retry
+    failing = {sid for sid, _ in get_failing_sources(min_consecutive=HEALTH_ALERT_THRESHOLD)}
 
     results = {}
-    health_records = []  # (source_id, success, error_message)
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {executor.submit(fetch_source, s): s for s in sources}
+    health_records = []  # (source_id, success, error_message, etag, last_modified, body_sha256)
+    # Parse in separate processes when there are cores to spare; forkserver because
+    # forking a process that is running download threads can deadlock the child
+    parser_pool = (
+        ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("forkserver"))
+        if PARSE_WORKERS > 1
+        else nullcontext()
+    )
+    # One thread per source up to the cap, so slow hosts don't queue behind each other
+    with (
+        parser_pool as parser,
+        ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(sources)))) as executor,
+    ):
+        futures = {
+            executor.submit(
+                fetch_source,
+                s,
+                timeout=FAILING_SOURCE_TIMEOUT if s["id"] in failing else FETCH_TIMEOUT,
+                cache=feed_cache.get(s["id"], NO_FEED_CACHE),
+                parser=parser,
+            ): s
+            for s in sources
+        }
         for future in as_completed(futures):
-            source_id, articles, error = future.result()
+            source_id, articles, error, cache = future.result()
             results[source_id] = articles
-            health_records.append((source_id, error is None, error))
+            health_records.append((source_id, error is None, error, *cache))
 
     # Record health to DB
     record_source_health(health_records)
 
-    # Filter by date and save, tracking per-source counts
-    total_kept = 0
-    total_fetched = 0
-    per_source_counts = []  # (source_id, fetched, kept)
-    for source in sources:
-        source_id = source["id"]
-        articles = results.get(source_id, [])
-        fetched_count = len(articles)
-        if last_run:
-            articles = [a for a in articles if (pub := parse_date(a.get("published"))) is None or pub > last_run]
-        kept_count = len(articles)
+    # Skip URLs already handed to Claude by a completed run (feeds return overlapping windows).
+    # Only sightings before the last successful run count, so a failed run doesn't lose articles.
+    url_hashes = {a["url"]: url_hash(a["url"]) for articles in results.values() for a in articles}
+    seen = get_seen_url_hashes(set(url_hashes.values()), last_run) if last_run else set()
 
-        with open(FETCHED_DIR / f"{source_id}.json", "w") as out_file:
-            json.dump(articles, out_file, indent=2)
-        total_kept += kept_count
-        total_fetched += fetched_count
-        per_source_counts.append((source_id, fetched_count, kept_count))
+    # Filter by date and write every kept article to a single JSONL file, in source order.
+    # Sequential on purpose: one file handle and an ordered write leave nothing to overlap on a pool
+    fetched_dir = staging_dir_for(FETCHED_DIR)
+    per_source_counts = []  # (source_id, fetched, kept)
+    with open(fetched_dir / FETCHED_ARTICLES_FILE, "w") as f:
+        for source in sources:
+            source_id = source["id"]
+            articles = results.get(source_id, [])
+            new_articles = articles
+            if last_run:
+                new_articles = [a for a in new_articles if published_after(a.get("published"), last_run, last_run_iso)]
+            if seen:
+                new_articles = [a for a in new_articles if url_hashes[a["url"]] not in seen]
+            f.writelines(json.dumps({"source_id": source_id, **a}) + "\n" for a in new_articles)
+            per_source_counts.append((source_id, len(articles), len(new_articles)))
+    swap_in_dir(fetched_dir, FETCHED_DIR)
+    total_fetched = sum(fetched for _, fetched, _ in per_source_counts)
+    total_kept = sum(kept for _, _, kept in per_source_counts)
+
+    record_seen_urls(set(url_hashes.values()))
 
     # Per-source breakdown (show sources with articles, sorted by kept desc)
     sources_with_articles = [(sid, f, k) for sid, f, k in per_source_counts if f > 0]
@@ -751,7 +1127,7 @@ def fetch_feeds(sources: list[dict]) -> tuple[int, int]:
             print(f"  [{sid}] {kept}/{fetched}", flush=True)
 
     # Summary
-    failed_this_run = [(sid, err) for sid, success, err in health_records if not success]
+    failed_this_run = [(sid, err) for sid, success, err, *_ in health_records if not success]
     succeeded = len(sources) - len(failed_this_run)
     log(f"Fetched {total_kept}/{total_fetched} articles from {succeeded}/{len(sources)} sources")
 
@@ -779,17 +1155,32 @@ def estimate_tokens(text: str) -> int:
     return len(text) // 4
 
 
+# Precompiled patterns for per-article text cleanup and CSS processing
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
+_RE_SCRIPT_STYLE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_RE_WS = re.compile(r"\s+")
+_RE_CSS_SPECIAL = re.compile(r"\s*([{};:,>])\s*")
+_RE_CSS_ROOT = re.compile(r":root\s*\{([^}]+)\}")
+_RE_CSS_VAR_DECL = re.compile(r"--([a-z-]+)\s*:\s*([^;]+);")
+_RE_CSS_VAR_USE = re.compile(r"var\(--([a-z-]+)\)")
+_RE_STYLE_BLOCK = re.compile(r"<style>([^<]+)</style>")
+_RE_CSS_DARK_MODE = re.compile(r"@media\s*\([^)]*prefers-color-scheme[^)]*\)\s*\{[^}]*\{[^}]*\}[^}]*\}")
+
+
 def strip_html(text: str) -> str:
-    """Remove HTML tags and decode entities."""
-    text = re.sub(r"<[^>]+>", "", text)  # Remove tags
+    """Remove HTML tags, decode entities, and normalize whitespace."""
+    if "<" not in text and "&" not in text:
+        return " ".join(text.split())  # Plain text (common in RSS) - nothing to strip or decode
+    # feedparser runs with sanitize_html=False, so drop script/style bodies, not just their tags
+    text = _RE_SCRIPT_STYLE.sub(" ", text)
+    text = _RE_HTML_TAG.sub("", text)  # Remove tags
     text = html.unescape(text)  # Decode &amp; etc
-    text = re.sub(r"\s+", " ", text).strip()  # Normalize whitespace
-    return text
+    return " ".join(text.split())  # Collapse and trim whitespace in one C-level pass
 
 
 def is_safe_url(url: str) -> bool:
-    """Validate URL has a safe scheme (http/https only)."""
-    return url.startswith(("http://", "https://"))
+    """Validate URL has a safe scheme (http/https only, any case)."""
+    return url[:8].lower().startswith(("http://", "https://"))
 
 
 def generate_feedback_html(email: str) -> str:
@@ -809,14 +1200,26 @@ def generate_feedback_html(email: str) -> str:
 csv.field_size_limit(1_000_000)  # 1MB max
 
 
+def strip_css_comments(css: str) -> str:
+    """Remove /* ... */ comments in one linear scan (an unterminated comment runs to the end)."""
+    parts = []
+    i = 0
+    while (start := css.find("/*", i)) >= 0:
+        parts.append(css[i:start])
+        end = css.find("*/", start + 2)
+        i = end + 2 if end >= 0 else len(css)
+    parts.append(css[i:])
+    return "".join(parts)
+
+
 def minify_css(css: str) -> str:
     """Minify CSS by removing comments, whitespace, and newlines."""
     # Remove comments
-    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = strip_css_comments(css)
     # Remove whitespace around special characters
-    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    css = _RE_CSS_SPECIAL.sub(r"\1", css)
     # Collapse multiple whitespace
-    css = re.sub(r"\s+", " ", css)
+    css = _RE_WS.sub(" ", css)
     return css.strip()
 
 
@@ -827,25 +1230,19 @@ def resolve_css_variables(css: str) -> str:
     resolve to light mode values and strip the dark mode media query.
     """
     # Extract variables from :root (first occurrence = light mode)
-    root_match = re.search(r":root\s*\{([^}]+)\}", css)
+    root_match = _RE_CSS_ROOT.search(css)
     if not root_match:
         return css
 
-    # Parse variables
-    variables = {}
-    for match in re.finditer(r"--([a-z-]+)\s*:\s*([^;]+);", root_match.group(1)):
-        variables[match.group(1)] = match.group(2).strip()
-
-    # Replace var(--name) with values
-    def replace_var(match):
-        var_name = match.group(1)
-        return variables.get(var_name, match.group(0))
+    # Parse variables (a later declaration of the same name wins, as in CSS)
+    variables = {name: value.strip() for name, value in _RE_CSS_VAR_DECL.findall(root_match.group(1))}
 
-    css = re.sub(r"var\(--([a-z-]+)\)", replace_var, css)
+    # Replace every var(--name) in one pass; unknown names are left as-is
+    css = _RE_CSS_VAR_USE.sub(lambda match: variables.get(match.group(1), match.group(0)), css)
 
     # Remove :root blocks and @media (prefers-color-scheme) - not supported in email
-    css = re.sub(r":root\s*\{[^}]+\}", "", css)
-    css = re.sub(r"@media\s*\([^)]*prefers-color-scheme[^)]*\)\s*\{[^}]*\{[^}]*\}[^}]*\}", "", css)
+    css = _RE_CSS_ROOT.sub("", css)
+    css = _RE_CSS_DARK_MODE.sub("", css)
 
     return css
 
@@ -864,7 +1261,7 @@ def prepare_for_email(html_content: str) -> str:
         minified_css = minify_css(resolved_css)
         return f"<style>{minified_css}</style>"
 
-    html_content = re.sub(r"<style>([^<]+)</style>", resolve_style_block, html_content)
+    html_content = _RE_STYLE_BLOCK.sub(resolve_style_block, html_content)
 
     # Inline styles for Gmail compatibility
     html_content = inline_styles(html_content)
@@ -883,6 +1280,7 @@ def inline_styles(html: str) -> str:
             keep_style_tags=True,  # Keep for clients that support <style>
             strip_important=False,
             cssutils_logging_level=50,  # Suppress warnings
+            disable_validation=True,  # cssutils profile validation dominated cold-start time
         )
     except ImportError:
         log("premailer not installed, skipping CSS inlining", "WARN")
@@ -907,6 +1305,9 @@ REGION_CONFIG = {
 REGION_ORDER = ["americas", "europe", "asia_pacific", "middle_east_africa", "tech"]
 
 
+_RE_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")  # [text](url)
+
+
 def markdown_to_html(text: str) -> str:
     """Convert markdown links [text](url) to HTML <a> tags."""
 
@@ -917,7 +1318,7 @@ def markdown_to_html(text: str) -> str:
             return f'<a href="{html.escape(url)}">{link_text}</a>'
         return link_text  # Return just text if URL is unsafe
 
-    return re.sub(r"\[([^\]]+)\]\(([^)]+)\)", replace_link, text)
+    return _RE_MARKDOWN_LINK.sub(replace_link, text)
 
 
 def render_article(article: dict, include_reporting_varies: bool = True) -> str:
@@ -1080,7 +1481,7 @@ def extract_preheader(selections: dict, max_length: int = 150) -> str:
         summary = regional_summary.get(region, "")
         if summary:
             # Strip markdown links, get plain text
-            plain = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", summary)
+            plain = _RE_MARKDOWN_LINK.sub(r"\1", summary)
             # Get first sentence or truncate
             first_sentence = plain.split(".")[0] + "."
             if len(first_sentence) <= max_length:
@@ -1089,9 +1490,31 @@ def extract_preheader(selections: dict, max_length: int = 150) -> str:
     return ""
 
 
-def replace_placeholders(digest_path: Path, preheader: str = ""):
+# Patterns that remove optional template fragments when their config is unset
+_RE_SOURCE_URL_SENTENCE = re.compile(
+    r'\s*This project is <a href="\{\{SOURCE_URL\}\}">[^<]+</a> and contributions are welcome\.'
+)
+_RE_FEEDBACK_PLACEHOLDER = re.compile(r"\s*\{\{FEEDBACK_BUTTONS\}\}")
+_RE_AUTHOR_PLUG = re.compile(r"\s*<p>\{\{AUTHOR_PLUG\}\}</p>")
+_RE_VIEW_IN_BROWSER = re.compile(r'\s*<p class="view-in-browser">[^<]*<a href="\{\{HOMEPAGE_URL\}\}">[^<]+</a></p>')
+_RE_ARCHIVE_LINK = re.compile(r'<a href="\{\{ARCHIVE_URL\}\}">[^<]+</a> · ')
+
+
+@lru_cache(maxsize=4)
+def load_styles(mtime_ns: int, size: int) -> str:
+    """Read and minify STYLES_FILE, keeping CSS variables intact.
+
+    Keyed on the file's mtime/size so an edited stylesheet is picked up without a restart.
+    """
+    return minify_css(STYLES_FILE.read_text())
+
+
+def replace_placeholders(digest_path: Path, preheader: str = "") -> str:
     """Replace all placeholders in digest HTML (styles, name, date, timestamp).
 
+    Writes the final HTML back to digest_path and returns it, so callers can
+    save/send without re-reading the file.
+
     CSS variables are preserved to support dark mode when viewing in browser.
     Email preparation (resolving variables, inlining) happens in send_broadcast().
     """
@@ -1108,8 +1531,8 @@ def replace_placeholders(digest_path: Path, preheader: str = ""):
     # Load CSS: minify but keep variables for dark mode support in browser
     if not STYLES_FILE.exists():
         raise RuntimeError(f"Styles file not found: {STYLES_FILE}")
-    css = STYLES_FILE.read_text()
-    styles = minify_css(css)  # Keep CSS variables intact
+    stat = STYLES_FILE.stat()
+    styles = load_styles(stat.st_mtime_ns, stat.st_size)
 
     content = digest_path.read_text()
 
@@ -1130,9 +1553,7 @@ def replace_placeholders(digest_path: Path, preheader: str = ""):
         content = content.replace("{{SOURCE_URL}}", source_url)
     else:
         # Remove the open source sentence in AI notice if not configured
-        content = re.sub(
-            r'\s*This project is <a href="\{\{SOURCE_URL\}\}">[^<]+</a> and contributions are welcome\.', "", content
-        )
+        content = _RE_SOURCE_URL_SENTENCE.sub("", content)
 
     # Feedback buttons (mailto links with pre-filled subject)
     # Uses RESEND_FROM since that's where replies go anyway
@@ -1141,7 +1562,7 @@ def replace_placeholders(digest_path: Path, preheader: str = ""):
         content = content.replace("{{FEEDBACK_BUTTONS}}", generate_feedback_html(feedback_email))
     else:
         # Remove the feedback buttons placeholder if not configured
-        content = re.sub(r"\s*\{\{FEEDBACK_BUTTONS\}\}", "", content)
+        content = _RE_FEEDBACK_PLACEHOLDER.sub("", content)
 
     # Optional: author plug (e.g., "Made by Sean · seanfloyd.dev")
     author_name = os.environ.get("AUTHOR_NAME", "")
@@ -1153,7 +1574,7 @@ def replace_placeholders(digest_path: Path, preheader: str = ""):
         content = content.replace("{{AUTHOR_PLUG}}", f"Made by {html.escape(author_name)}")
     else:
         # Remove the author plug paragraph if not configured
-        content = re.sub(r"\s*<p>\{\{AUTHOR_PLUG\}\}</p>", "", content)
+        content = _RE_AUTHOR_PLUG.sub("", content)
 
     # Replace HOMEPAGE_URL for "View in browser" link
     if digest_domain:
@@ -1161,30 +1582,72 @@ def replace_placeholders(digest_path: Path, preheader: str = ""):
         content = content.replace("{{HOMEPAGE_URL}}", homepage_url)
     else:
         # Remove the view-in-browser paragraph if not configured
-        content = re.sub(
-            r'\s*<p class="view-in-browser">[^<]*<a href="\{\{HOMEPAGE_URL\}\}">[^<]+</a></p>', "", content
-        )
+        content = _RE_VIEW_IN_BROWSER.sub("", content)
 
     # Optional: archive URL for "Past digests" link
     if archive_url and is_safe_url(archive_url):
         content = content.replace("{{ARCHIVE_URL}}", html.escape(archive_url))
     else:
         # Remove the archive link, keep just unsubscribe
-        content = re.sub(r'<a href="\{\{ARCHIVE_URL\}\}">[^<]+</a> · ', "", content)
+        content = _RE_ARCHIVE_LINK.sub("", content)
 
     # Note: CSS variable resolution and style inlining happen in send_broadcast()
     # to preserve dark mode support for web viewing
 
     digest_path.write_text(content)
     log(f"Timestamp: {timestamp}")
+    return content
+
+
+def iter_article_rows(
+    sources: list[dict], dedup_matcher: TfidfMatcher | None, filtered_similarities: list[float]
+) -> Iterator[list[str]]:
+    """Yield cleaned CSV rows from the fetched articles file, skipping TF-IDF duplicates.
+
+    Only articles from the given sources are kept. Similarity scores of filtered
+    articles are appended to filtered_similarities.
+    """
+    articles_file = FETCHED_DIR / FETCHED_ARTICLES_FILE
+    if not articles_file.exists():
+        return
+    source_ids = {s["id"] for s in sources}
+    with open(articles_file, "rb") as f:
+        for line in f:
+            a = json.loads(line)
+            source_id = a["source_id"]
+            if source_id not in source_ids:
+                continue
+            url = a.get("url", "")[:2000]  # Cap URL length
+            # Skip articles with unsafe URL schemes (e.g., javascript:, data:)
+            if not is_safe_url(url):
+                continue
+            # Strip HTML, escape for safety, and cap lengths
+            title = html.escape(strip_html(a.get("title") or ""))[:MAX_TITLE_LENGTH]
+            summary = html.escape(strip_html(a.get("summary") or ""))[:MAX_SUMMARY_LENGTH]
+
+            # TF-IDF dedup pre-filter
+            if dedup_matcher and title:
+                matched_headline, similarity = dedup_matcher.find_most_similar(title)
+                if similarity >= DEDUP_SIMILARITY_THRESHOLD:
+                    # Log and skip this article
+                    log_dedup_action(
+                        article_title=title,
+                        article_source_id=source_id,
+                        matched_headline=matched_headline or "",
+                        similarity=similarity,
+                        threshold=DEDUP_SIMILARITY_THRESHOLD,
+                        action="filtered",
+                    )
+                    filtered_similarities.append(similarity)
+                    continue
+
+            yield [source_id, title, url, a.get("published") or "", summary]
 
 
 def prepare_claude_input(sources: list[dict]) -> list[Path]:
     """Prepare CSV input files for Claude - split if too large."""
-    # Clean and recreate input directory
-    if CLAUDE_INPUT_DIR.exists():
-        shutil.rmtree(CLAUDE_INPUT_DIR)
-    CLAUDE_INPUT_DIR.mkdir(parents=True)
+    # Build in a staging directory, swapped in once complete
+    input_dir = staging_dir_for(CLAUDE_INPUT_DIR)
 
     # Get previous headlines for deduplication
     previous_headlines = get_previous_headlines(days=DEDUP_WINDOW_DAYS)
@@ -1194,92 +1657,46 @@ def prepare_claude_input(sources: list[dict]) -> list[Path]:
     dedup_matcher = TfidfMatcher(blocklist_headlines) if blocklist_headlines else None
 
     # Write sources CSV
-    sources_file = CLAUDE_INPUT_DIR / "sources.csv"
+    sources_file = input_dir / "sources.csv"
     with open(sources_file, "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(["id", "name", "bias", "perspective"])
-        for s in sources:
-            writer.writerow([s["id"], s["name"], s["bias"], s["perspective"]])
+        columns = ["id", "name", "bias", "perspective"]
+        writer.writerow(columns)
+        writer.writerows(map(operator.itemgetter(*columns), sources))
 
-    # Collect all articles, filtering duplicates via TF-IDF
-    all_articles = []
-    filtered_count = 0
+    # Stream rows straight into rotating CSV files (no intermediate list of all articles)
     filtered_similarities: list[float] = []
-    for source in sources:
-        source_file = FETCHED_DIR / f"{source['id']}.json"
-        if source_file.exists():
-            with open(source_file) as sf:
-                articles = json.load(sf)
-            for a in articles:
-                url = a.get("url", "")[:2000]  # Cap URL length
-                # Skip articles with unsafe URL schemes (e.g., javascript:, data:)
-                if not is_safe_url(url):
-                    continue
-                # Strip HTML, escape for safety, and cap lengths
-                title = html.escape(strip_html(a.get("title") or ""))[:MAX_TITLE_LENGTH]
-                summary = html.escape(strip_html(a.get("summary") or ""))[:MAX_SUMMARY_LENGTH]
-
-                # TF-IDF dedup pre-filter
-                if dedup_matcher and title:
-                    matched_headline, similarity = dedup_matcher.find_most_similar(title)
-                    if similarity >= DEDUP_SIMILARITY_THRESHOLD:
-                        # Log and skip this article
-                        log_dedup_action(
-                            article_title=title,
-                            article_source_id=source["id"],
-                            matched_headline=matched_headline or "",
-                            similarity=similarity,
-                            threshold=DEDUP_SIMILARITY_THRESHOLD,
-                            action="filtered",
-                        )
-                        filtered_count += 1
-                        filtered_similarities.append(similarity)
-                        continue
-
-                all_articles.append([source["id"], title, url, a.get("published", ""), summary])
-
-    # Split articles into multiple files if needed
-    article_files = []
-    current_file_num = 1
-    current_rows: list[list[str]] = []
-    current_tokens = 0
+    rows = iter_article_rows(sources, dedup_matcher, filtered_similarities)
     header = ["source_id", "title", "url", "published", "summary"]
-
-    for row in all_articles:
-        row_text = ",".join(str(x) for x in row)
-        row_tokens = estimate_tokens(row_text)
-
-        if current_tokens + row_tokens > MAX_TOKENS_PER_FILE and current_rows:
-            # Write current file and start new one
-            file_path = CLAUDE_INPUT_DIR / f"articles_{current_file_num}.csv"
-            with open(file_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(header)
-                writer.writerows(current_rows)
-            article_files.append(file_path)
-            current_file_num += 1
-            current_rows = []
-            current_tokens = 0
-
-        current_rows.append(row)
-        current_tokens += row_tokens
-
-    # Write final file
-    if current_rows:
-        file_path = CLAUDE_INPUT_DIR / f"articles_{current_file_num}.csv"
+    article_files: list[Path] = []
+    article_count = 0
+    row = next(rows, None)
+    while row is not None:
+        file_path = input_dir / f"articles_{len(article_files) + 1}.csv"
         with open(file_path, "w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(header)
-            writer.writerows(current_rows)
-        article_files.append(file_path)
-
-    if filtered_count > 0:
+            current_tokens = 0
+            while row is not None:
+                # Same as estimate_tokens(",".join(row)) without building the joined string
+                row_tokens = (sum(map(len, row)) + len(row) - 1) // 4
+                if current_tokens and current_tokens + row_tokens > MAX_TOKENS_PER_FILE:
+                    break  # Row starts the next file
+                writer.writerow(row)
+                current_tokens += row_tokens
+                article_count += 1
+                row = next(rows, None)
+        article_files.append(CLAUDE_INPUT_DIR / file_path.name)
+
+    swap_in_dir(input_dir, CLAUDE_INPUT_DIR)
+
+    if filtered_similarities:
         sim_min, sim_max = min(filtered_similarities), max(filtered_similarities)
         log(
-            f"Prepared {len(all_articles)} articles in {len(article_files)} file(s), {filtered_count} filtered as duplicates (sim {sim_min:.2f}-{sim_max:.2f})"
+            f"Prepared {article_count} articles in {len(article_files)} file(s), {len(filtered_similarities)} filtered as duplicates (sim {sim_min:.2f}-{sim_max:.2f})"
         )
     else:
-        log(f"Prepared {len(all_articles)} articles in {len(article_files)} file(s)")
+        log(f"Prepared {article_count} articles in {len(article_files)} file(s)")
     return article_files
 
 
@@ -1398,17 +1815,33 @@ def validate_signal(item: dict, tier: str, idx: int, cluster: str | None = None)
     return errors
 
 
+# Key aliases Claude sometimes uses: (alias, schema key), applied only when the schema key is absent
+_ARTICLE_KEY_RENAMES = (("title", "headline"),)
+_SIGNAL_KEY_RENAMES = (("one_liner", "headline"),)
+
+
+def rename_keys(item: dict, renames: tuple[tuple[str, str], ...]) -> int:
+    """Move aliased keys to their schema names in place. Returns the number renamed."""
+    renamed = 0
+    for alias, key in renames:
+        if alias in item and key not in item:
+            item[key] = item.pop(alias)
+            renamed += 1
+    return renamed
+
+
 def fix_selections_schema(selections: dict) -> dict:
-    """Fix common schema deviations from Claude's output."""
+    """Fix common schema deviations from Claude's output.
+
+    Edits selections in place (no copy) and returns the same dict.
+    """
     fixed = 0
 
     # Fix must_know and should_know articles
     for tier in ["must_know", "should_know"]:
         for article in selections.get(tier, []):
             # Fix: title instead of headline
-            if "title" in article and "headline" not in article:
-                article["headline"] = article.pop("title")
-                fixed += 1
+            fixed += rename_keys(article, _ARTICLE_KEY_RENAMES)
 
             # Fix: links array instead of url in sources
             if "links" in article and article.get("sources"):
@@ -1435,9 +1868,7 @@ def fix_selections_schema(selections: dict) -> dict:
                 fixed_cluster.append({"headline": item, "source": {"name": "Source", "url": "", "bias": "center"}})
                 fixed += 1
             elif isinstance(item, dict):
-                if "one_liner" in item and "headline" not in item:
-                    item["headline"] = item.pop("one_liner")
-                    fixed += 1
+                fixed += rename_keys(item, _SIGNAL_KEY_RENAMES)
                 if "link" in item and "source" not in item:
                     item["source"] = {"name": "Source", "url": item.pop("link"), "bias": "center"}
                     fixed += 1
@@ -1452,14 +1883,10 @@ def fix_selections_schema(selections: dict) -> dict:
     # Fix regional_summary - may be a single string instead of per-region dict
     regional_summary = selections.get("regional_summary", {})
     if isinstance(regional_summary, str):
-        # Split by ** headers or use as-is for all regions
-        selections["regional_summary"] = {
-            "americas": regional_summary,
-            "europe": "",
-            "asia_pacific": "",
-            "middle_east_africa": "",
-            "tech": "",
-        }
+        # Keep the whole text under americas (rendered first); the other regions stay empty
+        regions = dict.fromkeys(REGION_ORDER, "")
+        regions["americas"] = regional_summary
+        selections["regional_summary"] = regions
         fixed += 1
 
     if fixed > 0:
@@ -1536,8 +1963,12 @@ def validate_selections() -> dict:
     return selections
 
 
-def write_digest_from_selections(selections: dict) -> Path:
-    """Render selections to HTML and write digest file. Returns digest path."""
+def write_digest_from_selections(selections: dict) -> tuple[Path, list[dict]]:
+    """Render selections to HTML and write digest file. Returns (digest_path, shown_headlines).
+
+    shown_headlines.json is still written so --send-only can record headlines
+    after a failed broadcast; the normal pipeline uses the returned list.
+    """
     # Log stats
     must_know = len(selections.get("must_know", []))
     should_know = len(selections.get("should_know", []))
@@ -1559,18 +1990,18 @@ def write_digest_from_selections(selections: dict) -> Path:
     # Extract and write headlines for deduplication
     headlines = extract_headlines(selections)
     headlines_file = DATA_DIR / "shown_headlines.json"
-    with open(headlines_file, "w") as f:
-        json.dump(headlines, f, indent=2)
+    headlines_file.write_text(json.dumps(headlines, indent=2))
 
     log(f"Wrote {digest_path.name} ({len(headlines)} stories)")
-    return digest_path
+    return digest_path, headlines
 
 
 def find_latest_digest() -> Path | None:
     """Find most recent digest file (HTML or TXT)."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    digests = sorted(OUTPUT_DIR.glob("digest-*.*"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return digests[0] if digests else None
+    # Stems embed a sortable UTC timestamp (digest-YYYY-MM-DD-HHMMZ), so no stat() per file.
+    # Compare stems, not names: a legacy date-only digest-YYYY-MM-DD.txt would otherwise sort
+    # after same-day timestamped files, since "." > "-"
+    return max(OUTPUT_DIR.glob("digest-*.*"), key=lambda p: p.stem, default=None)
 
 
 # =============================================================================
@@ -1578,17 +2009,36 @@ def find_latest_digest() -> Path | None:
 # =============================================================================
 
 
+RESEND_MAX_RETRY_DELAY = 30  # Cap on any single rate-limit wait (seconds)
+
+
+def is_rate_limited(error: resend.exceptions.ResendError) -> bool:
+    """Check whether a Resend error is a retryable rate limit (not a daily/monthly quota 429)."""
+    return error.error_type == "rate_limit_exceeded"
+
+
+def rate_limit_delay(error: resend.exceptions.ResendError, attempt: int) -> float:
+    """Seconds to wait before retrying: honor Retry-After, else jittered exponential backoff."""
+    headers = getattr(error, "headers", None) or {}
+    retry_after = headers.get("Retry-After") or headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(float(retry_after), RESEND_MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form - fall back to backoff
+    return min(2**attempt + random.uniform(0, 1), RESEND_MAX_RETRY_DELAY)  # nosec B311
+
+
 def resend_with_retry(fn, *args, max_retries: int = 3, **kwargs):
-    """Call Resend API with exponential backoff on rate limit errors."""
+    """Call Resend API with jittered exponential backoff on rate limit errors."""
     for attempt in range(max_retries):
         try:
             return fn(*args, **kwargs)
         except resend.exceptions.ResendError as e:
-            is_rate_limited = "Too many requests" in str(e)
             has_retries_left = attempt < max_retries - 1
-            if is_rate_limited and has_retries_left:
-                delay = 2**attempt
-                log(f"Rate limited, retrying in {delay}s...", "WARN")
+            if is_rate_limited(e) and has_retries_left:
+                delay = rate_limit_delay(e, attempt)
+                log(f"Rate limited, retrying in {delay:.1f}s...", "WARN")
                 time.sleep(delay)
             else:
                 raise
@@ -1638,22 +2088,21 @@ def get_audience_contact_count(audience_id: str) -> int:
         if not isinstance(contacts, dict) or "data" not in contacts:
             log("Unexpected response from Resend Contacts.list", "WARN")
             return 0
-        return len([c for c in contacts["data"] if not c.get("unsubscribed")])
+        return sum(1 for c in contacts["data"] if not c.get("unsubscribed"))
     except resend.exceptions.ResendError as e:
         log(f"Failed to get audience contact count: {e}", "WARN")
         return 0
 
 
-def send_broadcast(digest_path: Path) -> int:
-    """Send digest via Resend Broadcasts API. Returns number of recipients."""
+def send_broadcast(digest_html: str) -> int:
+    """Send digest HTML via Resend Broadcasts API. Returns number of recipients."""
     resend.api_key = os.environ["RESEND_API_KEY"]
     from_email = os.environ["RESEND_FROM"]
     digest_name = os.environ.get("DIGEST_NAME", "News Digest")
     audience_id = os.environ["RESEND_AUDIENCE_ID"]
 
-    content = digest_path.read_text()
     # Prepare for email: resolve CSS variables and inline styles
-    content = prepare_for_email(content)
+    content = prepare_for_email(digest_html)
     date_str = datetime.now(UTC).strftime("%B %d, %Y")
 
     try:
@@ -1692,7 +2141,7 @@ def send_broadcast(digest_path: Path) -> int:
 def validate_single_feed(source: dict) -> dict:
     """Validate a single RSS feed. Returns result dict with status and metadata."""
     source_id = source["id"]
-    _, articles, error = fetch_source(source, timeout=15)
+    _, articles, error, _ = fetch_source(source, timeout=FETCH_TIMEOUT)
 
     result = {
         "id": source_id,
@@ -1709,12 +2158,22 @@ def validate_single_feed(source: dict) -> dict:
     result["article_count"] = len(articles)
 
     if articles:
-        dates = [parse_date(a.get("published")) for a in articles]
-        valid_dates = [d for d in dates if d is not None]
-        result["parseable_dates"] = len(valid_dates)
+        # Normalized ISO strings compare as text; only other formats need parsing
+        iso_dates: list[str] = []
+        valid_dates: list[datetime] = []
+        for a in articles:
+            published = a.get("published")
+            if is_utc_isoformat(published):
+                iso_dates.append(published)
+            elif (date := parse_date(published)) is not None:
+                valid_dates.append(date)
+        result["parseable_dates"] = len(iso_dates) + len(valid_dates)
+        if iso_dates:
+            valid_dates += [datetime.fromisoformat(min(iso_dates)), datetime.fromisoformat(max(iso_dates))]
         if valid_dates:
-            result["oldest_article"] = min(valid_dates).isoformat()
-            result["newest_article"] = max(valid_dates).isoformat()
+            # Kept as datetimes; serialized to ISO 8601 only for --json output
+            result["oldest_article"] = min(valid_dates)
+            result["newest_article"] = max(valid_dates)
         result["sample_headline"] = articles[0].get("title", "")
 
     return result
@@ -1733,8 +2192,8 @@ def print_feed_result(result: dict):
         print(f"  Status: OK - {article_count} articles")
 
         if result.get("oldest_article"):
-            oldest = datetime.fromisoformat(result["oldest_article"])
-            newest = datetime.fromisoformat(result["newest_article"])
+            oldest = result["oldest_article"]
+            newest = result["newest_article"]
             parseable = result.get("parseable_dates", 0)
             print(
                 f"  Dates: {oldest.strftime('%Y-%m-%d %H:%M')} → {newest.strftime('%Y-%m-%d %H:%M')} ({parseable}/{article_count} parseable)"
@@ -1750,19 +2209,24 @@ def print_feed_result(result: dict):
     print()
 
 
+BANNER_RULE = "=" * 60
+
+
 def validate_feeds(sources: list[dict], json_output: bool = False) -> int:
     """Test all RSS feeds and report health status. Returns exit code."""
     if not json_output:
-        print(f"\n{'=' * 60}")
+        print(f"\n{BANNER_RULE}")
         print("RSS Feed Validation")
-        print(f"{'=' * 60}")
+        print(BANNER_RULE)
         print(f"Testing {len(sources)} sources...\n")
 
-    # Collect results
-    results = [validate_single_feed(source) for source in sources]
-    if not json_output:
-        for result in results:
-            print_feed_result(result)
+    # Fetch in parallel like fetch_feeds; map() yields in source order so reports stay stable
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(sources)))) as executor:
+        for result in executor.map(validate_single_feed, sources):
+            results.append(result)
+            if not json_output:
+                print_feed_result(result)
 
     # Compute summary stats
     failed_count = sum(1 for r in results if r["error"])
@@ -1781,11 +2245,12 @@ def validate_feeds(sources: list[dict], json_output: bool = False) -> int:
             "sources": results,
             "persistently_failing": [{"id": sid, "consecutive_failures": count} for sid, count in persistently_failing],
         }
-        print(json.dumps(output, indent=2))
+        # Pretty-print for terminals only; compact output uses json's C encoder when piped
+        print(json.dumps(output, indent=2 if sys.stdout.isatty() else None, default=datetime.isoformat))
     else:
-        print(f"{'=' * 60}")
+        print(BANNER_RULE)
         print("Summary")
-        print(f"{'=' * 60}")
+        print(BANNER_RULE)
         print(f"Total sources: {len(sources)}")
         print(f"Successful: {len(sources) - failed_count}")
         print(f"Failed: {failed_count}")
@@ -1926,8 +2391,9 @@ Examples:
             log("No digest found to send", "ERROR")
             return 1
         log(f"Sending existing digest: {digest.name}")
-        save_digest(digest)  # Save before broadcast so link works
-        recipients = send_broadcast(digest)
+        digest_html = digest.read_text()
+        save_digest(get_digest_date(digest), digest_html)  # Save before broadcast so link works
+        recipients = send_broadcast(digest_html)
         shown_headlines = read_shown_headlines()
         if shown_headlines:
             record_shown_headlines(shown_headlines)
@@ -1941,20 +2407,18 @@ Examples:
         validate_env(dry_run=skip_email)
         init_db()
         selections = validate_selections()  # Ensure selections.json exists and is valid
-        digest = write_digest_from_selections(selections)
-        replace_placeholders(digest, extract_preheader(selections))
+        digest, shown_headlines = write_digest_from_selections(selections)
+        digest_html = replace_placeholders(digest, extract_preheader(selections))
         # Save before broadcast so link works
         if not skip_record:
-            save_digest(digest)
+            save_digest(get_digest_date(digest), digest_html)
         # Send broadcast
         recipients = 0
         if not skip_email:
-            recipients = send_broadcast(digest)
+            recipients = send_broadcast(digest_html)
         # Record run metadata
         if not skip_record:
-            shown_headlines = read_shown_headlines()
-            if shown_headlines:
-                record_shown_headlines(shown_headlines)
+            record_shown_headlines(shown_headlines)
             record_run(0, articles_emailed=recipients)
         cleanup_shown_headlines()
         return 0
@@ -1987,25 +2451,24 @@ Examples:
         return 0
 
     # Pass 2: Render HTML digest (Python - no Claude)
-    digest = write_digest_from_selections(selections)
-    replace_placeholders(digest, extract_preheader(selections))
+    digest, shown_headlines = write_digest_from_selections(selections)
+    digest_html = replace_placeholders(digest, extract_preheader(selections))
 
     # Save digest to DB BEFORE broadcast so "view in browser" link works immediately
     if not skip_record:
-        save_digest(digest)
+        save_digest(get_digest_date(digest), digest_html)
 
     # Send broadcast
     recipients = 0
     if not skip_email:
-        recipients = send_broadcast(digest)
+        recipients = send_broadcast(digest_html)
     else:
         log(f"Skipping broadcast: {digest.name}")
 
     # Record run metadata after broadcast succeeds
     if not skip_record:
-        shown_headlines = read_shown_headlines()
         if not shown_headlines:
-            log("No headlines recorded - Claude may not have generated shown_headlines.json", "WARN")
+            log("No headlines recorded - selections produced no headlines", "WARN")
         record_shown_headlines(shown_headlines)
         record_run(articles_fetched, articles_emailed=recipients)
 
@@ -1,25 +1,123 @@
 """Tests for run.py pure functions."""
 
+import gzip
+import io
+import json
+import os
 import sys
+import zlib
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime
 from pathlib import Path
 
 # Add parent to path so we can import run
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import pytest
+import resend
+
+import run
 from run import (
     TfidfMatcher,
+    entry_to_article,
     estimate_tokens,
     fix_selections_schema,
     generate_feedback_html,
+    get_digest_date,
+    is_rate_limited,
     is_safe_url,
     minify_css,
     parse_date,
+    published_after,
+    rate_limit_delay,
     resolve_css_variables,
     strip_html,
     tokenize,
+    url_hash,
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_log(tmp_path, monkeypatch):
+    """Send log() output to a temp file instead of the real data/digest.log."""
+    monkeypatch.setattr(run, "LOG_FILE", tmp_path / "digest.log")
+    monkeypatch.setattr(run, "_log_fh", None)
+
+
+class TestLogRotation:
+    def test_trims_to_half_the_byte_cap(self, monkeypatch):
+        """Long lines are trimmed by size, not just line count, so rotation doesn't rerun on every call."""
+        monkeypatch.setattr(run, "MAX_LOG_BYTES", 2000)
+        size = rewrites = 0
+        for i in range(200):
+            run.log(f"message {i:03d} " + "x" * 60)
+            new_size = run.LOG_FILE.stat().st_size
+            rewrites += new_size < size
+            size = new_size
+            assert size <= 2000
+        assert rewrites < 20
+        assert run.LOG_FILE.read_text().splitlines()[-1].endswith("message 199 " + "x" * 60)
+
+
+class TestLoadSources:
+    @pytest.fixture
+    def sources_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "sources.json"
+        monkeypatch.setattr(run, "SOURCES_FILE", path)
+        run._load_sources_cached.cache_clear()
+        yield path
+        run._load_sources_cached.cache_clear()
+
+    def write(self, path, url="https://a.example/feed"):
+        source = {"id": "src", "name": "Source", "url": url, "bias": "center", "perspective": "wire"}
+        path.write_text(json.dumps([source]))
+
+    def test_reuses_parse_until_file_changes(self, sources_file):
+        self.write(sources_file)
+        assert run.load_sources()[0]["url"] == "https://a.example/feed"
+        run.load_sources()
+        assert run._load_sources_cached.cache_info().hits == 1
+
+        self.write(sources_file, url="https://b.example/other-feed")
+        assert run.load_sources()[0]["url"] == "https://b.example/other-feed"
+
+    def test_invalid_file_is_not_cached(self, sources_file):
+        self.write(sources_file, url="ftp://aaa.example/feed")
+        stat = sources_file.stat()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="invalid URL"):
+                run.load_sources()
+
+        # Fixed in place with the same size and mtime - must be re-read, not served a cached failure
+        self.write(sources_file)
+        os.utime(sources_file, ns=(stat.st_mtime_ns, stat.st_mtime_ns))
+        assert sources_file.stat().st_size == stat.st_size
+        assert run.load_sources()[0]["url"] == "https://a.example/feed"
+
+    def test_callers_get_fresh_copies(self, sources_file):
+        self.write(sources_file)
+        sources = run.load_sources()
+        sources[0]["url"] = "https://mutated.example/"
+        sources.clear()
+        assert run.load_sources()[0]["url"] == "https://a.example/feed"
+
+
+class TestCheckInternet:
+    def refuse_connect(self, *args, **kwargs):
+        raise OSError("Network is unreachable")
+
+    def test_direct_probe_failure(self, monkeypatch):
+        monkeypatch.setattr(run.urllib.request, "getproxies", dict)
+        monkeypatch.setattr(run.socket, "create_connection", self.refuse_connect)
+        assert run.check_internet() is False
+
+    def test_skips_probe_behind_proxy(self, monkeypatch):
+        """Behind HTTP(S)_PROXY a direct connect can fail while feeds still fetch fine."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        monkeypatch.setattr(run.socket, "create_connection", self.refuse_connect)
+        assert run.check_internet() is True
+
+
 class TestEstimateTokens:
     def test_empty_string(self):
         assert estimate_tokens("") == 0
@@ -45,6 +143,10 @@ class TestStripHtml:
     def test_combined(self):
         assert strip_html("<div>Hello &amp; <b>World</b></div>") == "Hello & World"
 
+    def test_drops_script_and_style_bodies(self):
+        text = '<p>Hello</p><SCRIPT type="text/javascript">track("x < y");</script><style>p { color: red }</style> World'
+        assert strip_html(text) == "Hello World"
+
 
 class TestIsSafeUrl:
     def test_https_safe(self):
@@ -53,6 +155,9 @@ class TestIsSafeUrl:
     def test_http_safe(self):
         assert is_safe_url("http://example.com") is True
 
+    def test_uppercase_scheme_safe(self):
+        assert is_safe_url("HTTPS://example.com") is True
+
     def test_javascript_unsafe(self):
         assert is_safe_url("javascript:alert(1)") is False
 
@@ -71,6 +176,13 @@ class TestMinifyCss:
         css = "/* comment */ body { color: red; }"
         assert "comment" not in minify_css(css)
 
+    def test_removes_multiple_comments(self):
+        css = "a{color:red;}/* one */b{color:blue;}/* two\n*/"
+        assert minify_css(css) == "a{color:red;}b{color:blue;}"
+
+    def test_unterminated_comment_runs_to_end(self):
+        assert minify_css("a{color:red;}/* open") == "a{color:red;}"
+
     def test_removes_whitespace(self):
         css = "body {\n  color: red;\n}"
         assert minify_css(css) == "body{color:red;}"
@@ -122,6 +234,326 @@ class TestParseDate:
         assert parse_date("") is None
 
 
+class TestEntryToArticle:
+    def test_normalizes_parsed_date(self):
+        entry = {"title": " Hi ", "link": "https://e.com/1", "published_parsed": (2025, 1, 15, 10, 30, 0, 2, 15, 0)}
+        article = entry_to_article(entry)
+        assert article == {
+            "title": "Hi",
+            "url": "https://e.com/1",
+            "published": "2025-01-15T10:30:00+00:00",
+            "summary": "",
+        }
+
+    def test_falls_back_to_raw_date(self):
+        entry = {"title": "Hi", "link": "https://e.com/1", "published": "yesterday", "description": "d"}
+        assert entry_to_article(entry)["published"] == "yesterday"
+
+    def test_skips_missing_title_or_link(self):
+        assert entry_to_article({"title": "  ", "link": "https://e.com/1"}) is None
+        assert entry_to_article({"title": "Hi"}) is None
+
+
+class TestPublishedAfter:
+    cutoff = datetime(2025, 1, 15, 10, 30, tzinfo=UTC)
+    cutoff_iso = cutoff.isoformat()
+
+    def test_iso_string_compare(self):
+        assert published_after("2025-01-15T10:30:01+00:00", self.cutoff, self.cutoff_iso)
+        assert not published_after("2025-01-15T10:30:00+00:00", self.cutoff, self.cutoff_iso)
+
+    def test_other_formats_are_parsed(self):
+        assert published_after("Wed, 15 Jan 2025 11:00:00 GMT", self.cutoff, self.cutoff_iso)
+        assert not published_after("2025-01-15T12:00:00+05:00", self.cutoff, self.cutoff_iso)
+
+    def test_unknown_date_is_kept(self):
+        assert published_after(None, self.cutoff, self.cutoff_iso)
+        assert published_after("not a date", self.cutoff, self.cutoff_iso)
+
+
+class TestFindLatestDigest:
+    def test_newest_by_timestamp_across_legacy_names(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(run, "OUTPUT_DIR", tmp_path)
+        for name in ("digest-2025-01-14.html", "digest-2025-01-15.txt", "digest-2025-01-15-0800Z.html"):
+            (tmp_path / name).write_text("")
+        assert run.find_latest_digest() == tmp_path / "digest-2025-01-15-0800Z.html"
+
+    def test_no_digests(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(run, "OUTPUT_DIR", tmp_path / "output")
+        assert run.find_latest_digest() is None
+
+
+class TestGetDigestDate:
+    def test_extracts_date_from_filename(self):
+        assert get_digest_date(Path("digest-2025-01-15-0830Z.html")) == "2025-01-15"
+
+    def test_legacy_filename(self):
+        assert get_digest_date(Path("digest-2025-01-15.txt")) == "2025-01-15"
+
+
+class TestUrlHash:
+    def test_stable(self):
+        assert url_hash("https://example.com/a") == url_hash("https://example.com/a")
+
+    def test_distinct_urls(self):
+        assert url_hash("https://example.com/a") != url_hash("https://example.com/b")
+
+    def test_fits_sqlite_integer(self):
+        assert -(2**63) <= url_hash("https://example.com/a") < 2**63
+
+
+@pytest.fixture
+def tmp_db(tmp_path, monkeypatch):
+    """Point the DB and fetched/ at tmp_path, with feeds parsed inline."""
+    monkeypatch.setattr(run, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(run, "DB_PATH", tmp_path / "digest.db")
+    monkeypatch.setattr(run, "FETCHED_DIR", tmp_path / "fetched")
+    monkeypatch.setattr(run, "PARSE_WORKERS", 1)
+    run.init_db()
+    return tmp_path
+
+
+FEED_ARTICLE = {"title": "Story", "url": "https://example.com/story", "published": None, "summary": ""}
+
+
+def fake_feed_server(source, timeout=run.FETCH_TIMEOUT, cache=run.NO_FEED_CACHE, parser=None):
+    """Stand-in for fetch_source against a feed with one article and ETag "v1"."""
+    if cache[0] == '"v1"':
+        return source["id"], [], None, cache  # 304 Not Modified
+    return source["id"], [FEED_ARTICLE], None, ('"v1"', None, None)
+
+
+def fake_feed_without_validators(source, timeout=run.FETCH_TIMEOUT, cache=run.NO_FEED_CACHE, parser=None):
+    """Stand-in for fetch_source against a feed with no ETag/Last-Modified, skipped by body hash."""
+    if cache[2] == b"body-hash":
+        return source["id"], [], None, cache  # Same body as last time
+    return source["id"], [FEED_ARTICLE], None, (None, None, b"body-hash")
+
+
+class TestFeedCache:
+    def test_no_completed_run_no_cache(self, tmp_db):
+        run.record_source_health([("src", True, None, '"v1"', None, None)])
+        assert run.get_feed_cache(None) == {}
+
+    def test_ignores_fetches_after_last_completed_run(self, tmp_db):
+        with run.get_db() as conn:
+            conn.executemany(
+                "INSERT INTO source_health (source_id, success, recorded_at, etag) VALUES ('src', 1, ?, ?)",
+                [("2025-01-01 08:00:00", '"completed"'), ("2025-01-01 10:00:00", '"dry-run"')],
+            )
+        cache = run.get_feed_cache(datetime(2025, 1, 1, 9, tzinfo=UTC))
+        assert cache == {"src": ('"completed"', None, None)}
+
+    def test_dry_run_does_not_hide_articles_from_next_run(self, tmp_db, monkeypatch):
+        """A dry run stores validators but no run - the next real run must still get the article."""
+        monkeypatch.setattr(run, "fetch_source", fake_feed_server)
+        sources = [{"id": "src", "url": "https://example.com/feed"}]
+        assert run.fetch_feeds(sources) == (1, 0)  # Dry run: fetch_feeds without record_run
+        assert run.fetch_feeds(sources) == (1, 0)
+        articles_file = tmp_db / "fetched" / run.FETCHED_ARTICLES_FILE
+        assert len(articles_file.read_text().splitlines()) == 1
+
+    def test_dry_run_body_hash_does_not_hide_articles(self, tmp_db, monkeypatch):
+        monkeypatch.setattr(run, "fetch_source", fake_feed_without_validators)
+        sources = [{"id": "src", "url": "https://example.com/feed"}]
+        assert run.fetch_feeds(sources) == (1, 0)  # Dry run
+        assert run.fetch_feeds(sources) == (1, 0)
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal urllib response: a body plus headers."""
+
+    def __init__(self, body: bytes, headers: dict):
+        super().__init__(body)
+        self.headers = headers
+
+
+FEED_XML = b"<rss><channel><item><title>Story</title><link>https://example.com/s</link></item></channel></rss>"
+
+
+class TestPreviousHeadlines:
+    def test_newest_first(self, tmp_db):
+        with run.get_db() as conn:
+            conn.executemany(
+                "INSERT INTO shown_narratives (headline, tier, shown_at) VALUES (?, 'must_know', datetime('now', ?))",
+                [("Middle", "-2 days"), ("Newest", "-1 hours"), ("Oldest", "-5 days"), ("Expired", "-9 days")],
+            )
+        headlines = run.get_previous_headlines(days=7)
+        assert [h["headline"] for h in headlines] == ["Newest", "Middle", "Oldest"]
+        assert set(headlines[0]) == {"headline", "tier", "date"}
+
+
+def insert_fetches(rows):
+    """Insert (source_id, success, minutes_ago) rows into source_health, oldest first as given."""
+    with run.get_db() as conn:
+        conn.executemany(
+            "INSERT INTO source_health (source_id, success, recorded_at) VALUES (?, ?, datetime('now', ?))",
+            [(source_id, success, f"-{minutes} minutes") for source_id, success, minutes in rows],
+        )
+
+
+class TestFailingSources:
+    def test_counts_failures_since_last_success(self, tmp_db):
+        insert_fetches([("src", 0, 50), ("src", 1, 40), ("src", 0, 30), ("src", 0, 20), ("src", 0, 10)])
+        assert run.get_failing_sources() == [("src", 3)]
+
+    def test_recent_success_clears_source(self, tmp_db):
+        insert_fetches([("src", 0, 40), ("src", 0, 30), ("src", 0, 20), ("src", 1, 10)])
+        assert run.get_failing_sources() == []
+
+    def test_never_succeeded_counts_all_up_to_limit(self, tmp_db):
+        insert_fetches([("src", 0, minutes) for minutes in (50, 40, 30, 20, 10)])
+        assert run.get_failing_sources() == [("src", 5)]
+        assert run.get_failing_sources(limit=4) == [("src", 4)]
+
+    def test_ties_on_recorded_at_broken_by_insert_order(self, tmp_db):
+        """A success logged in the same second as a failure, but after it, is the latest fetch."""
+        insert_fetches([("src", 0, 30), ("src", 0, 20), ("src", 0, 10), ("src", 1, 10)])
+        assert run.get_failing_sources() == []
+
+    def test_most_failures_first(self, tmp_db):
+        insert_fetches(
+            [("few", 0, minutes) for minutes in (30, 20, 10)] + [("many", 0, minutes) for minutes in (50, 40, 30, 20, 10)]
+        )
+        assert run.get_failing_sources() == [("many", 5), ("few", 3)]
+
+    def test_ignores_sources_not_fetched_this_week(self, tmp_db):
+        insert_fetches([("stale", 0, minutes) for minutes in (20000, 19990, 19980)])
+        assert run.get_failing_sources() == []
+
+
+class TestShownHeadlinesDedup:
+    def test_migration_keeps_first_row_per_headline_per_day(self, tmp_db):
+        """An old database with same-day repeats keeps MIN(id) per (headline, day) when the index is added."""
+        with run.get_db() as conn:
+            conn.execute("DROP INDEX idx_shown_narratives_headline_day")
+            conn.executemany(
+                "INSERT INTO shown_narratives (id, headline, tier, shown_at) VALUES (?, ?, 'must_know', ?)",
+                [
+                    (1, "Story", "2025-01-01 08:00:00"),
+                    (2, "Story", "2025-01-01 20:00:00"),
+                    (3, "Story", "2025-01-02 08:00:00"),
+                    (4, "Other", "2025-01-01 09:00:00"),
+                    (5, "Other", "2025-01-01 10:00:00"),
+                ],
+            )
+        run.init_db()
+        with run.get_db() as conn:
+            ids = [row[0] for row in conn.execute("SELECT id FROM shown_narratives ORDER BY id")]
+            index = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_shown_narratives_headline_day'"
+            ).fetchone()
+        assert ids == [1, 3, 4]
+        assert index is not None
+
+    def test_recording_twice_same_day_adds_nothing(self, tmp_db):
+        headlines = [{"headline": "Story", "tier": "must_know"}, {"headline": "Other", "tier": "should_know"}]
+        run.record_shown_headlines(headlines)
+        run.record_shown_headlines(headlines)
+        with run.get_db() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM shown_narratives").fetchone()[0] == 2
+
+
+def write_fetched(articles):
+    """Write fetched/articles.jsonl as fetch_feeds would."""
+    run.FETCHED_DIR.mkdir(exist_ok=True)
+    (run.FETCHED_DIR / run.FETCHED_ARTICLES_FILE).write_text("".join(json.dumps(a) + "\n" for a in articles))
+
+
+class TestPrepareClaudeInput:
+    def test_second_run_replaces_previous_output(self, tmp_db, monkeypatch):
+        """Each run swaps in a complete directory: returned paths exist and no stale files remain."""
+        monkeypatch.setattr(run, "CLAUDE_INPUT_DIR", tmp_db / "claude_input")
+        monkeypatch.setattr(run, "MAX_TOKENS_PER_FILE", 20)
+        sources = [{"id": "src", "name": "Source", "bias": "center", "perspective": "wire"}]
+        story = {"source_id": "src", "url": "https://example.com/", "published": None, "summary": ""}
+
+        write_fetched([{**story, "title": f"Unrelated headline number {i}"} for i in range(3)])
+        first = run.prepare_claude_input(sources)
+        assert len(first) == 3
+        assert all(path.exists() for path in first)
+
+        write_fetched([{**story, "title": "Only story"}])
+        second = run.prepare_claude_input(sources)
+        assert second == [run.CLAUDE_INPUT_DIR / "articles_1.csv"]
+        assert second[0].exists()
+        assert "Only story" in second[0].read_text()
+        assert sorted(p.name for p in run.CLAUDE_INPUT_DIR.iterdir()) == ["articles_1.csv", "sources.csv"]
+        assert not (tmp_db / "claude_input.new").exists()
+
+
+class TestReadFeedBody:
+    def test_plain(self):
+        assert run.read_feed_body(FakeResponse(FEED_XML, {})) == FEED_XML
+
+    def test_gzip(self):
+        response = FakeResponse(gzip.compress(FEED_XML), {"Content-Encoding": "gzip"})
+        assert run.read_feed_body(response) == FEED_XML
+
+    def test_zlib_wrapped_deflate(self):
+        response = FakeResponse(zlib.compress(FEED_XML), {"Content-Encoding": "deflate"})
+        assert run.read_feed_body(response) == FEED_XML
+
+    def test_raw_deflate(self):
+        """Servers often send deflate without the zlib header."""
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw = compressor.compress(FEED_XML) + compressor.flush()
+        response = FakeResponse(raw, {"Content-Encoding": "deflate"})
+        assert run.read_feed_body(response) == FEED_XML
+
+    def test_corrupt_gzip_fails_without_retry(self, monkeypatch):
+        opened = []
+
+        class FakeOpener:
+            def open(self, req, timeout):
+                opened.append(req)
+                return FakeResponse(b"not gzip at all", {"Content-Encoding": "gzip"})
+
+        monkeypatch.setattr(run, "_feed_opener", FakeOpener())
+        _, articles, error, _ = run.fetch_source({"id": "src", "url": "https://example.com/feed"})
+        assert articles == []
+        assert error is not None and error.startswith("Feed decode error")
+        assert len(opened) == 1
+
+
+class TestFetchSource:
+    def test_slow_failing_source_recovers_on_last_attempt(self, monkeypatch):
+        """A source on the short failing-source timeout still gets FETCH_TIMEOUT on its final try."""
+        timeouts = []
+
+        class SlowOpener:
+            def open(self, req, timeout):
+                timeouts.append(timeout)
+                if timeout < run.FETCH_TIMEOUT:
+                    raise TimeoutError("timed out")
+                return FakeResponse(FEED_XML, {})
+
+        monkeypatch.setattr(run, "_feed_opener", SlowOpener())
+        monkeypatch.setattr(run, "RETRY_DELAY", 0)
+        source = {"id": "src", "url": "https://example.com/feed"}
+        _, articles, error, _ = run.fetch_source(source, timeout=run.FAILING_SOURCE_TIMEOUT)
+        assert error is None
+        assert len(articles) == 1
+        assert timeouts[-1] == run.FETCH_TIMEOUT
+
+    def test_broken_parse_pool_falls_back_to_thread(self, monkeypatch):
+        """A dead parse worker breaks the pool; the feed is still parsed in the fetch thread."""
+
+        class BrokenPool:
+            def submit(self, fn, *args):
+                raise BrokenProcessPool("A child process terminated abruptly")
+
+        class FeedOpener:
+            def open(self, req, timeout):
+                return FakeResponse(FEED_XML, {})
+
+        monkeypatch.setattr(run, "_feed_opener", FeedOpener())
+        source = {"id": "src", "url": "https://example.com/feed"}
+        _, articles, error, _ = run.fetch_source(source, parser=BrokenPool())
+        assert error is None
+        assert len(articles) == 1
+
+
 class TestFixSelectionsSchema:
     """Tests for Claude output normalization - where bugs hide."""
 
@@ -253,6 +685,16 @@ class TestFixSelectionsSchema:
         result = fix_selections_schema({"must_know": []})
         assert result == {"must_know": []}
 
+    def test_fixes_in_place(self):
+        """Fixes are applied to the given dict rather than a copy."""
+        selections = self._base_selections()
+        selections["must_know"] = [{"title": "Breaking News", "summary": "Sum", "why_it_matters": "Why", "sources": []}]
+
+        result = fix_selections_schema(selections)
+
+        assert result is selections
+        assert selections["must_know"][0]["headline"] == "Breaking News"
+
 
 class TestTokenize:
     def test_lowercases(self):
@@ -313,6 +755,11 @@ class TestTfidfMatcher:
         assert headline == "France passes social media ban for minors"
         assert score > 0.5
 
+    def test_zero_idf_query(self):
+        # "alpha" appears in 1 of 2 headlines: idf = log(2 / 2) = 0, so the query vector is all zeros
+        matcher = TfidfMatcher(["alpha beta", "gamma delta"])
+        assert matcher.find_most_similar("alpha") == (None, 0.0)
+
 
 class TestGenerateFeedbackHtml:
     def test_contains_all_buttons(self):
@@ -335,3 +782,44 @@ class TestGenerateFeedbackHtml:
         result = generate_feedback_html("<script>@evil.com")
         assert "<script>" not in result
         assert "&lt;script&gt;" in result
+
+
+def resend_error(code, headers=None, error_type="rate_limit_exceeded"):
+    return resend.exceptions.ResendError(
+        code=code, error_type=error_type, message="Too many requests", suggested_action="", headers=headers
+    )
+
+
+class TestRateLimitRetry:
+    def test_detects_rate_limit(self):
+        assert is_rate_limited(resend_error(429)) is True
+        assert is_rate_limited(resend_error("429")) is True
+
+    def test_ignores_other_errors(self):
+        assert is_rate_limited(resend_error(422, error_type="validation_error")) is False
+
+    def test_ignores_quota_exceeded(self):
+        assert is_rate_limited(resend_error(429, error_type="daily_quota_exceeded")) is False
+        assert is_rate_limited(resend_error(429, error_type="monthly_quota_exceeded")) is False
+
+    def test_quota_exceeded_not_retried(self, monkeypatch):
+        calls = []
+
+        def send():
+            calls.append(1)
+            raise resend_error(429, error_type="daily_quota_exceeded")
+
+        monkeypatch.setattr(run.time, "sleep", lambda s: pytest.fail("quota errors must not be retried"))
+        with pytest.raises(resend.exceptions.ResendError):
+            run.resend_with_retry(send)
+        assert len(calls) == 1
+
+    def test_honors_retry_after(self):
+        assert rate_limit_delay(resend_error(429, {"Retry-After": "5"}), attempt=0) == 5.0
+
+    def test_caps_retry_after(self):
+        assert rate_limit_delay(resend_error(429, {"Retry-After": "3600"}), attempt=0) == 30
+
+    def test_jittered_backoff(self):
+        delay = rate_limit_delay(resend_error(429), attempt=2)
+        assert 4 <= delay <= 5